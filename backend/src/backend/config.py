@@ -3,7 +3,7 @@ Configuration settings for the application.
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
 
     # Temporary file storage
     UPLOAD_DIR: str = "/tmp/uploads"
+    TEMP_DIR: Optional[str] = None  # Where uploaded bytes are staged for parsing (None: system temp dir)
 
     # Corroboration settings
     AUDIT_LOG_PATH: str = "/tmp/corroboration_audit"
@@ -0,0 +1,52 @@
+"""
+Exact statistics of 8-bit image values from their level histogram.
+
+Used by the ELA, noise and compression checks of the image analysis service.
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+# The 256 values an 8-bit channel (or ELA error level) can take
+UINT8_LEVELS = np.arange(256, dtype=np.int64)
+
+
+class LevelStatistics(NamedTuple):
+    """Counts per 8-bit level with the total, mean and population variance they imply."""
+
+    counts: np.ndarray
+    total: int
+    mean: float
+    variance: float
+
+
+def level_statistics(histogram) -> LevelStatistics:
+    """
+    Statistics of the 8-bit values counted in a histogram.
+
+    The sums run over the 256 levels in exact integer arithmetic instead of a
+    float pass over every value. Mean and variance are NaN when nothing was counted.
+
+    Args:
+        histogram: 256 counts per band, e.g. PIL's Image.histogram() (bands
+            are pooled) or np.bincount(values, minlength=256)
+
+    Returns:
+        LevelStatistics of the pooled values
+    """
+    counts = np.asarray(histogram, dtype=np.int64).reshape(-1, 256).sum(axis=0)
+    total = int(counts.sum())
+    if not total:
+        return LevelStatistics(counts, 0, math.nan, math.nan)
+
+    level_sum = int(counts @ UINT8_LEVELS)
+    level_sq_sum = int(counts @ (UINT8_LEVELS * UINT8_LEVELS))
+    variance = (level_sq_sum * total - level_sum * level_sum) / (total * total)
+    return LevelStatistics(counts, total, level_sum / total, variance)
+
+
+def uint8_variance(values: np.ndarray) -> float:
+    """Population variance of a uint8 array (NaN when empty, like np.var)."""
+    return level_statistics(np.bincount(values.ravel(), minlength=256)).variance
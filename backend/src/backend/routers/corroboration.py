@@ -5,7 +5,11 @@ from fastapi.responses import PlainTextResponse
 from typing import Optional, List, Dict, Any
 import json
 
-from backend.services.corroboration_service import CorroborationService
+from backend.services.corroboration_service import (
+    CorroborationService,
+    DOCUMENT_EXTENSIONS,
+    IMAGE_EXTENSIONS,
+)
 from backend.schemas.validation import (
     CorroborationReport,
     CorroborationRequest,
@@ -96,7 +100,7 @@ async def analyze_image_only(
     """
     # Validate file extension
     file_ext = f".{file.filename.split('.')[-1].lower()}"
-    if file_ext not in [".png", ".jpg", ".jpeg", ".tiff", ".bmp"]:
+    if file_ext not in IMAGE_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported image type. Allowed: ['.png', '.jpg', '.jpeg', '.tiff', '.bmp']"
@@ -216,7 +220,7 @@ async def validate_format_only(
     """
     file_ext = f".{file.filename.split('.')[-1].lower()}"
 
-    if file_ext not in [".pdf", ".docx", ".txt"]:
+    if file_ext not in DOCUMENT_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail="Unsupported file type for format validation"
@@ -266,7 +270,7 @@ async def validate_structure_only(
     """
     file_ext = f".{file.filename.split('.')[-1].lower()}"
 
-    if file_ext not in [".pdf", ".docx", ".txt"]:
+    if file_ext not in DOCUMENT_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail="Unsupported file type for structure validation"
@@ -88,7 +88,7 @@ async def extract_tables(
         import tempfile
         from pathlib import Path
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, dir=settings.TEMP_DIR) as tmp_file:
             tmp_file.write(contents)
             tmp_path = Path(tmp_file.name)
 
@@ -1,10 +1,12 @@
 """Main corroboration service that orchestrates all validation services."""
 
+import asyncio
 import time
 import tempfile
 from pathlib import Path
 from typing import Optional
 
+from backend.config import settings
 from backend.services.document_validator import DocumentValidator
 from backend.services.image_analyzer import ImageAnalyzer
 from backend.services.risk_scorer import RiskScorer
@@ -19,6 +21,10 @@ from backend.schemas.validation import (
     ImageAnalysisResult,
 )
 
+# File extensions routed to image analysis and to document validation
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tiff", ".bmp"})
+DOCUMENT_EXTENSIONS = frozenset({".pdf", ".docx", ".txt"})
+
 
 class CorroborationService:
     """Main service for orchestrating document and image corroboration."""
@@ -53,14 +59,14 @@ class CorroborationService:
 
         # Save to temporary file
         file_ext = Path(filename).suffix.lower()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, dir=settings.TEMP_DIR) as tmp_file:
             tmp_file.write(file_bytes)
             tmp_path = Path(tmp_file.name)
 
         try:
             # Determine if this is an image or document
-            is_image = file_ext in ['.png', '.jpg', '.jpeg', '.tiff', '.bmp']
-            is_document = file_ext in ['.pdf', '.docx', '.txt']
+            is_image = file_ext in IMAGE_EXTENSIONS
+            is_document = file_ext in DOCUMENT_EXTENSIONS
 
             format_validation: Optional[FormatValidationResult] = None
             structure_validation: Optional[StructureValidationResult] = None
@@ -83,29 +89,38 @@ class CorroborationService:
                     perform_reverse_search=request.enable_reverse_image_search,
                 )
 
-            # 2. Format Validation (for documents)
-            if is_document and request.perform_format_validation and text_content:
-                engines_used.append("format_validator")
-                format_validation = await self.document_validator.validate_format(
-                    text_content,
-                    tmp_path,
-                )
-
-            # 3. Structure Validation (for documents)
-            if is_document and request.perform_structure_validation and text_content:
-                engines_used.append("structure_validator")
-                structure_validation = await self.document_validator.validate_structure(
-                    text_content,
-                    tmp_path,
-                    expected_document_type=request.expected_document_type,
-                )
-
-            # 4. Content Validation (for documents)
-            if is_document and request.perform_content_validation and text_content:
-                engines_used.append("content_validator")
-                content_validation = await self.document_validator.validate_content(
-                    text_content,
-                )
+            # 2-4. Document validations, run concurrently so the spaCy pass of
+            # format validation overlaps with the structure and content checks
+            validations = {}
+            if is_document and text_content:
+                # 2. Format Validation
+                if request.perform_format_validation:
+                    engines_used.append("format_validator")
+                    validations["format"] = self.document_validator.validate_format(
+                        text_content,
+                        tmp_path,
+                    )
+
+                # 3. Structure Validation
+                if request.perform_structure_validation:
+                    engines_used.append("structure_validator")
+                    validations["structure"] = self.document_validator.validate_structure(
+                        text_content,
+                        tmp_path,
+                        expected_document_type=request.expected_document_type,
+                    )
+
+                # 4. Content Validation
+                if request.perform_content_validation:
+                    engines_used.append("content_validator")
+                    validations["content"] = self.document_validator.validate_content(
+                        text_content,
+                    )
+
+            results = dict(zip(validations, await asyncio.gather(*validations.values())))
+            format_validation = results.get("format")
+            structure_validation = results.get("structure")
+            content_validation = results.get("content")
 
             # 5. Calculate Risk Score
             engines_used.append("risk_scorer")
@@ -157,7 +172,7 @@ class CorroborationService:
         """
         file_ext = Path(filename).suffix.lower()
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, dir=settings.TEMP_DIR) as tmp_file:
             tmp_file.write(file_bytes)
             tmp_path = Path(tmp_file.name)
 
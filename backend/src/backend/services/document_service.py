@@ -1,13 +1,15 @@
 """Document parsing service using Docling."""
 
+import asyncio
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-import tempfile
 from datetime import datetime
+from io import BytesIO
+from functools import cached_property, lru_cache
 
-from docling.document_converter import DocumentConverter
-from docling.datamodel.base_models import InputFormat
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 
 from backend.schemas.document import (
@@ -16,34 +18,104 @@ from backend.schemas.document import (
     DocumentPage,
 )
 
+# Serializes convert() on the shared converters: Docling does not document
+# a converter (and the models it holds) as safe to use from several threads.
+# Waiting happens on the event loop, so queued conversions do not hold
+# worker threads of the default executor.
+_CONVERT_LOCK = asyncio.Lock()
+
+
+def get_document_converter(ocr: bool = True, tables: bool = True) -> DocumentConverter:
+    """
+    Return the process-wide Docling converter for the given pipeline stages.
+
+    Docling loads layout and OCR models per converter, so every service
+    shares one instance per (ocr, tables) combination instead of rebuilding it.
+
+    Args:
+        ocr: Whether to run OCR on PDF pages
+        tables: Whether to run table structure recognition
+
+    Returns:
+        Shared DocumentConverter
+    """
+    return _build_converter(ocr, tables)
+
+
+async def convert_document(converter: DocumentConverter, source: Any) -> Any:
+    """
+    Run converter.convert(source) in a worker thread, one conversion at a time.
+
+    The lock is taken before the work is handed to the thread.
+
+    Args:
+        converter: Converter from get_document_converter
+        source: File path or DocumentStream to convert
+
+    Returns:
+        Docling conversion result
+    """
+    async with _CONVERT_LOCK:
+        return await asyncio.to_thread(converter.convert, source)
+
+
+@lru_cache(maxsize=4)
+def _build_converter(ocr: bool, tables: bool) -> DocumentConverter:
+    """Build a Docling converter with the given PDF pipeline stages."""
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = ocr
+    pipeline_options.do_table_structure = tables
+
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options),
+        }
+    )
+
 
 class DocumentService:
     """Service for parsing documents (PDF, DOCX, etc.) using Docling."""
 
     def __init__(self):
         """Initialize the document service."""
-        # Configure Docling with full pipeline options
-        self.pipeline_options = PdfPipelineOptions()
-        self.pipeline_options.do_ocr = True
-        self.pipeline_options.do_table_structure = True
-
-        self.converter = DocumentConverter(
-            # format_options={
-            #     InputFormat.PDF: PdfFormatOption(
-            #         pipeline_cls=VlmPipeline,
-            #     ),
-            # }
+        # The Docling converter loads its models, so it is built lazily on first use
+
+    @cached_property
+    def pipeline_options(self) -> PdfPipelineOptions:
+        """Docling pipeline options with the full pipeline enabled."""
+        pipeline_options = PdfPipelineOptions()
+        pipeline_options.do_ocr = True
+        pipeline_options.do_table_structure = True
+        return pipeline_options
+
+    @cached_property
+    def converter(self) -> DocumentConverter:
+        """Docling document converter, shared across the process."""
+        return get_document_converter(
+            ocr=self.pipeline_options.do_ocr,
+            tables=self.pipeline_options.do_table_structure,
         )
 
+    def _get_converter(self, ocr: bool, tables: bool) -> DocumentConverter:
+        """Return the converter for the requested pipeline stages."""
+        if ocr == self.pipeline_options.do_ocr and tables == self.pipeline_options.do_table_structure:
+            return self.converter
+        return get_document_converter(ocr=ocr, tables=tables)
+
     async def parse_document(
         self,
         file_path: Path,
+        *,
+        ocr: bool = True,
+        tables: bool = True,
     ) -> DocumentParseResponse:
         """
         Parse a document and extract text, tables, and metadata.
 
         Args:
             file_path: Path to the document file
+            ocr: Run OCR on PDF pages (disable for text-only PDFs)
+            tables: Run table structure recognition
 
         Returns:
             DocumentParseResponse with extracted content and metadata
@@ -51,57 +123,23 @@ class DocumentService:
         start_time = time.time()
 
         try:
-            # Convert the document using Docling
-            result = self.converter.convert(str(file_path))
-            # print(result)
-
-            # Extract full text as markdown
-            full_text = result.document.export_to_markdown()
+            # Convert the document using Docling (in a worker thread, one conversion at a time)
+            converter = self._get_converter(ocr, tables)
+            result = await convert_document(converter, str(file_path))
 
-            # Extract metadata
+            # Extract metadata (a single stat call covers size and mtime)
+            file_stat = file_path.stat()
             metadata = DocumentMetadata(
                 file_name=file_path.name,
                 file_type=file_path.suffix,
-                file_size=file_path.stat().st_size,
+                file_size=file_stat.st_size,
                 page_count=result.document.num_pages(),
                 author=None,  # Can be extracted from document properties if available
                 created_date=None,
-                modified_date=datetime.fromtimestamp(file_path.stat().st_mtime),
+                modified_date=datetime.fromtimestamp(file_stat.st_mtime),
             )
 
-            # Extract pages
-            pages = []
-            if hasattr(result.document, 'pages'):
-                for idx, page in enumerate(result.document.pages):
-                    page_text = ""
-                    if hasattr(page, 'export_to_markdown'):
-                        page_text = page.export_to_markdown()
-
-                    pages.append(DocumentPage(
-                        page_number=idx + 1,
-                        text=page_text,
-                        images_count=0,  # Can be enhanced
-                        tables_count=0,  # Can be enhanced
-                    ))
-
-            # Extract tables
-            tables = []
-            if hasattr(result.document, 'tables'):
-                for table in result.document.tables:
-                    # Convert table to dictionary format
-                    if hasattr(table, 'export_to_dict'):
-                        tables.append(table.export_to_dict())
-
-            processing_time = time.time() - start_time
-
-            return DocumentParseResponse(
-                text=full_text,
-                pages=pages,
-                metadata=metadata,
-                tables=tables if tables else None,
-                images=None,  # Can be enhanced with image extraction
-                processing_time=processing_time,
-            )
+            return self._build_response(result, metadata, start_time)
 
         except Exception as e:
             raise Exception(f"Document parsing failed: {str(e)}")
@@ -110,6 +148,9 @@ class DocumentService:
         self,
         file_bytes: bytes,
         filename: str,
+        *,
+        ocr: bool = True,
+        tables: bool = True,
     ) -> DocumentParseResponse:
         """
         Parse document bytes.
@@ -117,21 +158,83 @@ class DocumentService:
         Args:
             file_bytes: Document file bytes
             filename: Original filename
+            ocr: Run OCR on PDF pages (disable for text-only PDFs)
+            tables: Run table structure recognition
 
         Returns:
             DocumentParseResponse with extracted content and metadata
         """
-        # Save bytes to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(filename).suffix) as tmp_file:
-            tmp_file.write(file_bytes)
-            tmp_path = Path(tmp_file.name)
+        start_time = time.time()
 
         try:
-            return await self.parse_document(tmp_path)
-        finally:
-            # Clean up temporary file
-            if tmp_path.exists():
-                tmp_path.unlink()
+            # Docling reads the upload straight from memory, no temporary file needed
+            source = DocumentStream(name=filename, stream=BytesIO(file_bytes))
+            converter = self._get_converter(ocr, tables)
+            result = await convert_document(converter, source)
+
+            metadata = DocumentMetadata(
+                file_name=filename,
+                file_type=Path(filename).suffix,
+                file_size=len(file_bytes),
+                page_count=result.document.num_pages(),
+                author=None,  # Can be extracted from document properties if available
+                created_date=None,
+                modified_date=datetime.now(),
+            )
+
+            return self._build_response(result, metadata, start_time)
+
+        except Exception as e:
+            raise Exception(f"Document parsing failed: {str(e)}")
+
+    def _build_response(
+        self,
+        result: Any,
+        metadata: DocumentMetadata,
+        start_time: float,
+    ) -> DocumentParseResponse:
+        """
+        Build the parse response from a Docling conversion result.
+
+        Args:
+            result: Docling conversion result
+            metadata: Metadata describing the source document
+            start_time: Time the parse started, for processing_time
+
+        Returns:
+            DocumentParseResponse with extracted content and metadata
+        """
+        # Extract full text as markdown
+        full_text = result.document.export_to_markdown()
+
+        # Extract pages
+        pages = []
+        if hasattr(result.document, 'pages'):
+            for idx, page in enumerate(result.document.pages):
+                page_text = ""
+                if hasattr(page, 'export_to_markdown'):
+                    page_text = page.export_to_markdown()
+
+                pages.append(DocumentPage(
+                    page_number=idx + 1,
+                    text=page_text,
+                    images_count=0,  # Can be enhanced
+                    tables_count=0,  # Can be enhanced
+                ))
+
+        # Extract tables
+        tables = self._export_tables(result.document)
+
+        processing_time = time.time() - start_time
+
+        return DocumentParseResponse(
+            text=full_text,
+            pages=pages,
+            metadata=metadata,
+            tables=tables if tables else None,
+            images=None,  # Can be enhanced with image extraction
+            processing_time=processing_time,
+        )
 
     async def extract_tables(self, file_path: Path) -> List[Dict[str, Any]]:
         """
@@ -143,12 +246,15 @@ class DocumentService:
         Returns:
             List of tables as dictionaries
         """
-        result = self.converter.convert(str(file_path))
+        result = await convert_document(self.converter, str(file_path))
 
-        tables = []
-        if hasattr(result.document, 'tables'):
-            for table in result.document.tables:
-                if hasattr(table, 'export_to_dict'):
-                    tables.append(table.export_to_dict())
+        return self._export_tables(result.document)
 
-        return tables
+    @staticmethod
+    def _export_tables(document: Any) -> List[Dict[str, Any]]:
+        """Convert every exportable table in a Docling document to dictionary format."""
+        return [
+            table.export_to_dict()
+            for table in getattr(document, 'tables', None) or ()
+            if hasattr(table, 'export_to_dict')
+        ]
@@ -1,11 +1,18 @@
 """Document validation service for format, structure, and content checks."""
 
+import asyncio
 import re
+import hashlib
+import itertools
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import spacy
 from docling.document_converter import DocumentConverter
 
+from backend.services.document_service import get_document_converter
 from backend.schemas.validation import (
     FormatValidationResult,
     StructureValidationResult,
@@ -14,21 +21,97 @@ from backend.schemas.validation import (
     ValidationSeverity,
 )
 
+# Fixed issue descriptions shared by every validation run
+ISSUE_IRREGULAR_LINE_BREAKS = "Document has irregular line breaks (3+ consecutive newlines)"
+ISSUE_MIXED_INDENTATION = "Document has mixed indentation (both tabs and spaces)"
+ISSUE_MISSING_HEADERS = "Document appears to lack proper section headers"
+ISSUE_SENSITIVE_DATA = "Document may contain sensitive personal information (PII)"
+ISSUE_LOW_READABILITY = "Document has low readability score"
+
+# spaCy pipeline components that format validation never reads
+_SPACY_UNUSED_COMPONENTS = ["parser", "ner", "lemmatizer"]
+
+# Documents with no more words than this are reported as incomplete
+_MIN_COMPLETE_WORDS = 100
+
+# Maximum number of characters passed to spaCy for the spell check
+_SPELL_CHECK_MAX_CHARS = 10000
+
+# Identity numbers (SSN, credit card) combined into one alternation so the
+# text is scanned once for both
+_ID_NUMBER_PATTERN = re.compile(
+    r'\b\d{3}-\d{2}-\d{4}\b'  # SSN
+    r'|\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b'  # Credit card
+)
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Shortest text any PII pattern can match (an SSN such as 123-45-6789)
+_MIN_PII_LENGTH = 11
+
+# Byte classes used for vectorized readability counting
+_OTHER, _WHITESPACE, _VOWEL, _SENTENCE_END = range(4)
+
+
+def _build_byte_classes() -> bytes:
+    """Build a bytes.translate table mapping every byte to its class."""
+    table = bytearray(256)  # _OTHER
+    for byte in b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f":
+        table[byte] = _WHITESPACE
+    for byte in b"aeiouyAEIOUY":
+        table[byte] = _VOWEL
+    for byte in b".!?":
+        table[byte] = _SENTENCE_END
+    return bytes(table)
+
+
+_BYTE_CLASSES = _build_byte_classes()
+
+# Runs of two or more whitespace characters (double spaces, blank lines)
+_SPACING_RUN_PATTERN = re.compile(r'\s{2,}')
+
+# Lines that look like section headers (capitalized, short, letters only)
+_HEADER_PATTERN = re.compile(r'^[A-Z][A-Za-z\s]{3,50}$', re.MULTILINE)
+
+
+@lru_cache(maxsize=64)
+def _section_pattern(section: str) -> re.Pattern:
+    """Compile the case-insensitive whole-word pattern for a section name."""
+    return re.compile(rf'\b{re.escape(section)}\b', re.IGNORECASE)
+
+
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_VOWEL_GROUP_PATTERN = re.compile(r'[aeiouy]+')
+
 
 class DocumentValidator:
     """Service for validating document format, structure, and content."""
 
+    # Maximum number of validation results kept in each LRU cache
+    CACHE_MAX_SIZE = 512
+
     def __init__(self):
         """Initialize the document validator."""
-        self.converter = DocumentConverter()
-
-        # Try to load spaCy model, fallback to basic validation if not available
+        # LRU caches of validation results keyed by text digest
+        self._format_cache: "OrderedDict[bytes, FormatValidationResult]" = OrderedDict()
+        self._content_cache: "OrderedDict[bytes, ContentValidationResult]" = OrderedDict()
+        # spaCy does not document a Language as safe to call from several
+        # threads, so spell checks take turns (waiting on the event loop)
+        self._nlp_lock = asyncio.Lock()
+
+        # Try to load spaCy model, fallback to basic validation if not available.
+        # The spell check only reads lexical flags and the tagger's POS, so the
+        # parser, NER and lemmatizer are not loaded.
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=_SPACY_UNUSED_COMPONENTS)
         except OSError:
             self.nlp = None
             print("Warning: spaCy model not found. Some validation features will be limited.")
 
+    @cached_property
+    def converter(self) -> DocumentConverter:
+        """Docling document converter, shared across the process."""
+        return get_document_converter()
+
     async def validate_format(self, text: str, file_path: Path) -> FormatValidationResult:
         """
         Validate document formatting.
@@ -40,12 +123,24 @@ class DocumentValidator:
         Returns:
             FormatValidationResult with formatting analysis
         """
+        cache_key = self._content_key(text)
+        cached = self._cache_get(self._format_cache, cache_key)
+        if cached is not None:
+            return cached
+
         issues: List[ValidationIssue] = []
 
-        # Check for double spacing issues
-        has_double_spacing = bool(re.search(r'\s{2,}', text))
+        # Start the spaCy spell check in a worker thread so it overlaps with the
+        # formatting scans below (blank text has no words to check)
+        spelling_task: Optional[asyncio.Task] = None
+        if self.nlp and text and not text.isspace():
+            spelling_task = asyncio.create_task(self._check_spelling(self._spell_check_sample(text)))
+
+        # Check for double spacing issues (one scan yields both the flag and the count)
+        spacing_runs = _SPACING_RUN_PATTERN.findall(text)
+        count = len(spacing_runs)
+        has_double_spacing = count > 0
         if has_double_spacing:
-            count = len(re.findall(r'\s{2,}', text))
             issues.append(ValidationIssue(
                 category="formatting",
                 severity=ValidationSeverity.LOW,
@@ -53,26 +148,31 @@ class DocumentValidator:
                 details={"spacing_issues_count": count}
             ))
 
-        # Check for inconsistent line breaks
-        has_irregular_breaks = bool(re.search(r'\n{3,}', text))
+        # Check for inconsistent line breaks (any run of 3+ newlines lies inside a
+        # whitespace run, so only the runs found above need to be searched)
+        has_irregular_breaks = any('\n\n\n' in run for run in spacing_runs)
         if has_irregular_breaks:
             issues.append(ValidationIssue(
                 category="formatting",
                 severity=ValidationSeverity.LOW,
-                description="Document has irregular line breaks (3+ consecutive newlines)",
+                description=ISSUE_IRREGULAR_LINE_BREAKS,
             ))
 
         # Check for mixed indentation (tabs vs spaces in structured content)
-        lines = text.split('\n')
-        tab_lines = sum(1 for line in lines if line.startswith('\t'))
-        space_indent_lines = sum(1 for line in lines if re.match(r'^\s{2,}', line))
+        tab_lines = 0
+        space_indent_lines = 0
+        for line in text.split('\n'):
+            if line.startswith('\t'):
+                tab_lines += 1
+            if len(line) > 1 and line[:2].isspace():
+                space_indent_lines += 1
         has_indentation_issues = tab_lines > 0 and space_indent_lines > 0
 
         if has_indentation_issues:
             issues.append(ValidationIssue(
                 category="formatting",
                 severity=ValidationSeverity.MEDIUM,
-                description="Document has mixed indentation (both tabs and spaces)",
+                description=ISSUE_MIXED_INDENTATION,
                 details={"tab_lines": tab_lines, "space_indent_lines": space_indent_lines}
             ))
 
@@ -80,10 +180,8 @@ class DocumentValidator:
         spelling_error_count = 0
         has_spelling_errors = False
 
-        if self.nlp:
-            doc = self.nlp(text[:10000])  # Limit to first 10k chars for performance
-            # Simple spell check: look for unknown words
-            unknown_words = [token.text for token in doc if not token.is_alpha or (token.is_alpha and not token.is_stop and token.pos_ == 'X')]
+        if spelling_task is not None:
+            unknown_words = await spelling_task
             spelling_error_count = len(unknown_words)
             has_spelling_errors = spelling_error_count > 5  # Threshold
 
@@ -92,14 +190,14 @@ class DocumentValidator:
                     category="content",
                     severity=ValidationSeverity.MEDIUM,
                     description=f"Detected {spelling_error_count} potential spelling errors or unknown words",
-                    details={"sample_errors": unknown_words[:10]}
+                    details={"sample_errors": list(dict.fromkeys(unknown_words))[:10]}
                 ))
 
         # Font consistency check (basic heuristic based on formatting markers)
         has_font_inconsistencies = False
         # This is a placeholder - in a real system, you'd analyze PDF metadata
 
-        return FormatValidationResult(
+        result = FormatValidationResult(
             has_double_spacing=has_double_spacing,
             has_font_inconsistencies=has_font_inconsistencies,
             has_indentation_issues=has_indentation_issues,
@@ -108,6 +206,9 @@ class DocumentValidator:
             issues=issues,
         )
 
+        self._cache_put(self._format_cache, cache_key, result)
+        return result
+
     async def validate_structure(
         self,
         text: str,
@@ -134,8 +235,7 @@ class DocumentValidator:
         missing_sections = []
         for section in expected_sections:
             # Case-insensitive search for section headers
-            pattern = re.compile(rf'\b{re.escape(section)}\b', re.IGNORECASE)
-            if not pattern.search(text):
+            if not _section_pattern(section).search(text):
                 missing_sections.append(section)
 
         if missing_sections:
@@ -147,24 +247,24 @@ class DocumentValidator:
             ))
 
         # Check for proper headers (basic heuristic)
-        header_pattern = re.compile(r'^[A-Z][A-Za-z\s]{3,50}$', re.MULTILINE)
-        headers = header_pattern.findall(text)
+        headers = _HEADER_PATTERN.findall(text)
         has_correct_headers = len(headers) >= 2  # At least 2 proper headers
 
         if not has_correct_headers:
             issues.append(ValidationIssue(
                 category="structure",
                 severity=ValidationSeverity.MEDIUM,
-                description="Document appears to lack proper section headers",
+                description=ISSUE_MISSING_HEADERS,
             ))
 
         # Calculate template match score
         sections_found = len(expected_sections) - len(missing_sections)
         template_match_score = sections_found / len(expected_sections) if expected_sections else 1.0
 
-        # Check document completeness (length heuristic)
-        word_count = len(text.split())
-        is_complete = word_count > 100  # Basic threshold
+        # Check document completeness (length heuristic). Splitting stops just past
+        # the threshold; the exact count is only reported below it.
+        word_count = len(text.split(maxsplit=_MIN_COMPLETE_WORDS + 1))
+        is_complete = word_count > _MIN_COMPLETE_WORDS  # Basic threshold
 
         if not is_complete:
             issues.append(ValidationIssue(
@@ -192,36 +292,51 @@ class DocumentValidator:
         Returns:
             ContentValidationResult with content analysis
         """
+        cache_key = self._content_key(text)
+        cached = self._cache_get(self._content_cache, cache_key)
+        if cached is not None:
+            return cached
+
         issues: List[ValidationIssue] = []
 
-        # Check for sensitive data patterns (PII)
-        has_sensitive_data = self._detect_sensitive_data(text)
+        # Blank text carries no PII and no countable words
+        is_blank = not text or text.isspace()
+
+        # Check for sensitive data patterns (PII), skipping text too short to match any
+        has_sensitive_data = (
+            not is_blank
+            and len(text) >= _MIN_PII_LENGTH
+            and self._detect_sensitive_data(text)
+        )
 
         if has_sensitive_data:
             issues.append(ValidationIssue(
                 category="content",
                 severity=ValidationSeverity.HIGH,
-                description="Document may contain sensitive personal information (PII)",
+                description=ISSUE_SENSITIVE_DATA,
             ))
 
+        # Count words, sentences and syllables once for all text metrics
+        if is_blank:
+            word_count, sentence_count, syllables = 0, 1, 0
+        else:
+            word_count, sentence_count, syllables = self._count_text_units(text)
+
         # Calculate readability score (Flesch Reading Ease)
-        readability_score = self._calculate_readability(text)
+        readability_score = self._calculate_readability(word_count, sentence_count, syllables)
 
         if readability_score < 30:  # Very difficult to read
             issues.append(ValidationIssue(
                 category="content",
                 severity=ValidationSeverity.LOW,
-                description="Document has low readability score",
+                description=ISSUE_LOW_READABILITY,
                 details={"readability_score": readability_score}
             ))
 
-        # Word count
-        word_count = len(text.split())
-
         # Quality score (composite metric)
         quality_score = self._calculate_quality_score(text, readability_score, word_count)
 
-        return ContentValidationResult(
+        result = ContentValidationResult(
             has_sensitive_data=has_sensitive_data,
             quality_score=quality_score,
             readability_score=readability_score,
@@ -229,6 +344,48 @@ class DocumentValidator:
             issues=issues,
         )
 
+        self._cache_put(self._content_cache, cache_key, result)
+        return result
+
+    @staticmethod
+    def _content_key(text: str) -> bytes:
+        """Compute a compact cache key for the given text."""
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    async def _check_spelling(self, text: str) -> List[str]:
+        """Run _find_unknown_words in a worker thread, one spaCy call at a time."""
+        async with self._nlp_lock:
+            return await asyncio.to_thread(self._find_unknown_words, text)
+
+    def _find_unknown_words(self, text: str) -> List[str]:
+        """Run spaCy over the text and collect tokens that look misspelled."""
+        doc = self.nlp(text)
+        # Simple spell check: look for unknown words
+        return [token.text for token in doc if not token.is_alpha or (token.is_alpha and not token.is_stop and token.pos_ == 'X')]
+
+    @staticmethod
+    def _spell_check_sample(text: str) -> str:
+        """Limit text to the first 10k chars for performance, cut at a word boundary."""
+        if len(text) <= _SPELL_CHECK_MAX_CHARS:
+            return text
+        cut = text.rfind(" ", 0, _SPELL_CHECK_MAX_CHARS)
+        return text[:cut if cut > 0 else _SPELL_CHECK_MAX_CHARS]
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: bytes) -> Optional[Any]:
+        """Return a copy of a cached result, marking it most recently used."""
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        cache.move_to_end(key)
+        return cached.model_copy(deep=True)
+
+    def _cache_put(self, cache: OrderedDict, key: bytes, result: Any) -> None:
+        """Store a copy of a result, evicting the least recently used entry."""
+        cache[key] = result.model_copy(deep=True)
+        if len(cache) > self.CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
     def _get_expected_sections(self, document_type: Optional[str]) -> List[str]:
         """Get expected sections based on document type."""
         templates = {
@@ -241,44 +398,87 @@ class DocumentValidator:
 
     def _detect_sensitive_data(self, text: str) -> bool:
         """Detect potential PII or sensitive data."""
-        # SSN pattern
-        ssn_pattern = r'\b\d{3}-\d{2}-\d{4}\b'
-        # Credit card pattern
-        cc_pattern = r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b'
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-
-        return bool(
-            re.search(ssn_pattern, text) or
-            re.search(cc_pattern, text) or
-            len(re.findall(email_pattern, text)) > 5  # More than 5 emails might be unusual
-        )
-
-    def _calculate_readability(self, text: str) -> float:
-        """Calculate Flesch Reading Ease score."""
-        words = text.split()
-        sentences = re.split(r'[.!?]+', text)
-        syllables = sum(self._count_syllables(word) for word in words)
-
-        if len(sentences) == 0 or len(words) == 0:
+        if _ID_NUMBER_PATTERN.search(text):
+            return True
+
+        # More than 5 emails might be unusual; stop scanning once that is reached
+        if "@" not in text:
+            return False
+        emails = _EMAIL_PATTERN.finditer(text)
+        return sum(1 for _ in itertools.islice(emails, 6)) > 5
+
+    def _calculate_readability(self, word_count: int, sentence_count: int, syllables: int) -> float:
+        """Calculate Flesch Reading Ease score from precomputed text counts."""
+        if sentence_count == 0 or word_count == 0:
             return 0.0
 
         # Flesch Reading Ease formula
-        score = 206.835 - 1.015 * (len(words) / len(sentences)) - 84.6 * (syllables / len(words))
+        score = 206.835 - 1.015 * (word_count / sentence_count) - 84.6 * (syllables / word_count)
         return max(0.0, min(100.0, score))
 
-    def _count_syllables(self, word: str) -> int:
+    def _count_text_units(self, text: str) -> Tuple[int, int, int]:
+        """
+        Count words, sentences and syllables in a single vectorized pass.
+
+        Words are whitespace-separated tokens, sentences are the segments
+        between runs of '.', '!' or '?', and syllables are vowel groups per
+        word (minus a trailing silent 'e', at least one per word).
+        """
+        # Byte classes only match str semantics for ASCII (Unicode whitespace,
+        # case mappings), so other text takes the per-word path
+        if not text.isascii():
+            return self._count_text_units_unicode(text)
+
+        raw = text.encode("ascii")
+        if not raw:
+            return 0, 1, 0
+
+        # Classify every byte in one C-level translate pass
+        classes = np.frombuffer(raw.translate(_BYTE_CLASSES), dtype=np.uint8)
+        is_space = classes == _WHITESPACE
+        is_vowel = classes == _VOWEL
+        is_sentence_end = classes == _SENTENCE_END
+
+        # A run starts wherever a mask is set and the previous byte's is not
+        sentence_starts = is_sentence_end.copy()
+        sentence_starts[1:] &= ~is_sentence_end[:-1]
+        sentence_count = 1 + int(np.count_nonzero(sentence_starts))
+
+        in_word = ~is_space
+        word_starts = in_word.copy()
+        word_starts[1:] &= is_space[:-1]
+        word_count = int(np.count_nonzero(word_starts))
+        if word_count == 0:
+            return 0, sentence_count, 0
+
+        word_ends = in_word.copy()
+        word_ends[:-1] &= is_space[1:]
+
+        # Vowel groups never span words, so a segmented sum of group starts
+        # between consecutive word starts yields the count for each word
+        group_starts = is_vowel.copy()
+        group_starts[1:] &= ~is_vowel[:-1]
+        per_word = np.add.reduceat(group_starts, np.flatnonzero(word_starts), dtype=np.intp)
+
+        # Adjust for silent e
+        end_bytes = np.frombuffer(raw, dtype=np.uint8)[word_ends]
+        per_word -= (end_bytes == ord("e")) | (end_bytes == ord("E"))
+
+        syllables = int(np.maximum(per_word, 1).sum())
+        return word_count, sentence_count, syllables
+
+    def _count_text_units_unicode(self, text: str) -> Tuple[int, int, int]:
+        """Count words, sentences and syllables for non-ASCII text."""
+        words = text.split()
+        sentence_count = len(_SENTENCE_SPLIT_PATTERN.split(text))
+        syllables = sum(map(self._count_syllables, words))
+        return len(words), sentence_count, syllables
+
+    @staticmethod
+    def _count_syllables(word: str) -> int:
         """Count syllables in a word (simple heuristic)."""
         word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        previous_was_vowel = False
-
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
+        syllable_count = len(_VOWEL_GROUP_PATTERN.findall(word))
 
         # Adjust for silent e
         if word.endswith('e'):
@@ -1,7 +1,9 @@
 """Image analysis service for authenticity verification and tampering detection."""
 
+import asyncio
 import io
-import hashlib
+import math
+import os
 from pathlib import Path
 from typing import List, Optional, Tuple
 from PIL import Image, ImageChops, ImageEnhance
@@ -9,16 +11,33 @@ import numpy as np
 from datetime import datetime
 import json
 
+from backend.image_stats import UINT8_LEVELS, level_statistics, uint8_variance
 from backend.schemas.validation import (
     ImageAnalysisResult,
     ValidationIssue,
     ValidationSeverity,
 )
 
+def _laplacian_uint8(gray: np.ndarray) -> np.ndarray:
+    """5-point Laplacian of an 8-bit image, wrapped to uint8.
+
+    Same result as scipy.ndimage.convolve(gray, [[0, 1, 0], [1, -4, 1], [0, 1, 0]])
+    (reflected borders, output in the input dtype), computed with four shifted
+    adds on an int16 copy instead of a generic kernel pass.
+    """
+    padded = np.pad(gray.astype(np.int16), 1, mode="symmetric")
+    center = padded[1:-1, 1:-1]
+    laplacian = padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+    laplacian -= 4 * center
+    return laplacian.astype(np.uint8)
+
 
 class ImageAnalyzer:
     """Service for analyzing image authenticity and detecting tampering."""
 
+    # Maximum number of images analyzed concurrently by analyze_images
+    MAX_CONCURRENT_ANALYSES = max(1, (os.cpu_count() or 2) // 2)
+
     def __init__(self):
         """Initialize the image analyzer."""
         pass
@@ -41,7 +60,9 @@ class ImageAnalyzer:
         metadata_issues: List[ValidationIssue] = []
         forensic_findings: List[ValidationIssue] = []
 
-        # Load image
+        # Load image (a missing path fails on one stat, before PIL is involved)
+        if not image_path.is_file():
+            raise ValueError(f"Failed to load image: no such file: {image_path}")
         try:
             image = Image.open(image_path)
         except Exception as e:
@@ -50,15 +71,24 @@ class ImageAnalyzer:
         # 1. EXIF Metadata Analysis
         metadata_issues.extend(await self._analyze_metadata(image, image_path))
 
-        # 2. AI-Generated Detection
-        is_ai_generated, ai_confidence = await self._detect_ai_generated(image)
-
-        # 3. Tampering Detection using ELA (Error Level Analysis)
-        is_tampered, tampering_confidence, ela_findings = await self._detect_tampering_ela(image_path)
+        # Decode once; every pixel-level check shares the RGB image and array
+        rgb_image = image if image.mode == 'RGB' else image.convert('RGB')
+        img_array = np.asarray(rgb_image)
+
+        # 2. AI-Generated Detection, 3. Tampering Detection using ELA (Error Level
+        # Analysis) and 4. additional forensic checks only read the decoded image,
+        # so they run concurrently
+        (
+            (is_ai_generated, ai_confidence),
+            (is_tampered, tampering_confidence, ela_findings),
+            additional_findings,
+        ) = await asyncio.gather(
+            self._detect_ai_generated(img_array),
+            self._detect_tampering_ela(image, rgb_image),
+            self._forensic_analysis(img_array),
+        )
         forensic_findings.extend(ela_findings)
-
-        # 4. Additional forensic checks
-        forensic_findings.extend(await self._forensic_analysis(image))
+        forensic_findings.extend(additional_findings)
 
         # 5. Reverse image search (placeholder - requires API integration)
         reverse_image_matches = 0
@@ -79,6 +109,35 @@ class ImageAnalyzer:
             forensic_findings=forensic_findings,
         )
 
+    async def analyze_images(
+        self,
+        image_paths: List[Path],
+        perform_reverse_search: bool = True,
+    ) -> List[ImageAnalysisResult]:
+        """
+        Analyze several images concurrently.
+
+        At most MAX_CONCURRENT_ANALYSES images are decoded and analyzed at
+        once to bound CPU and memory usage.
+
+        Args:
+            image_paths: Paths to the image files
+            perform_reverse_search: Whether to perform reverse image search
+
+        Returns:
+            List of ImageAnalysisResult in the same order as image_paths
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYSES)
+
+        async def analyze_one(image_path: Path) -> ImageAnalysisResult:
+            async with semaphore:
+                return await self.analyze_image(
+                    image_path,
+                    perform_reverse_search=perform_reverse_search,
+                )
+
+        return await asyncio.gather(*(analyze_one(image_path) for image_path in image_paths))
+
     async def _analyze_metadata(self, image: Image.Image, image_path: Path) -> List[ValidationIssue]:
         """Analyze image EXIF metadata for inconsistencies."""
         issues: List[ValidationIssue] = []
@@ -145,7 +204,7 @@ class ImageAnalyzer:
 
         return issues
 
-    async def _detect_ai_generated(self, image: Image.Image) -> Tuple[bool, float]:
+    async def _detect_ai_generated(self, img_array: np.ndarray) -> Tuple[bool, float]:
         """
         Detect if image is AI-generated using heuristic analysis.
 
@@ -160,12 +219,16 @@ class ImageAnalyzer:
         confidence_score = 0.0
         checks_performed = 0
 
-        # Convert to numpy array
-        img_array = np.array(image.convert('RGB'))
+        # The checks are independent NumPy work, so run them in worker threads
+        noise_level, color_entropy, edge_score, has_ai_artifacts = await asyncio.gather(
+            asyncio.to_thread(self._calculate_noise_level, img_array),
+            asyncio.to_thread(self._calculate_color_entropy, img_array),
+            asyncio.to_thread(self._analyze_edges, img_array),
+            asyncio.to_thread(self._check_ai_artifacts, img_array),
+        )
 
         # Check 1: Noise analysis
         # Real photos have natural noise, AI images often don't
-        noise_level = self._calculate_noise_level(img_array)
         checks_performed += 1
 
         if noise_level < 5.0:  # Very low noise
@@ -173,7 +236,6 @@ class ImageAnalyzer:
 
         # Check 2: Color distribution analysis
         # AI images often have unusual color distributions
-        color_entropy = self._calculate_color_entropy(img_array)
         checks_performed += 1
 
         if color_entropy < 5.0:  # Low entropy
@@ -181,14 +243,12 @@ class ImageAnalyzer:
 
         # Check 3: Edge consistency
         # AI images may have overly smooth or perfect edges
-        edge_score = self._analyze_edges(img_array)
         checks_performed += 1
 
         if edge_score > 0.8:  # Very consistent edges
             confidence_score += 0.2
 
         # Check 4: Artifacts typical of AI generation
-        has_ai_artifacts = self._check_ai_artifacts(img_array)
         checks_performed += 1
 
         if has_ai_artifacts:
@@ -202,19 +262,32 @@ class ImageAnalyzer:
 
         return is_ai_generated, round(final_confidence, 3)
 
-    async def _detect_tampering_ela(self, image_path: Path) -> Tuple[bool, float, List[ValidationIssue]]:
+    async def _detect_tampering_ela(
+        self,
+        original: Image.Image,
+        original_rgb: Image.Image,
+    ) -> Tuple[bool, float, List[ValidationIssue]]:
         """
         Detect tampering using Error Level Analysis (ELA).
 
         ELA identifies areas of an image with different compression levels,
         which can indicate manipulation.
+
+        Args:
+            original: Decoded image as loaded from disk
+            original_rgb: The same image converted to RGB
         """
+        return await asyncio.to_thread(self._run_ela, original, original_rgb)
+
+    def _run_ela(
+        self,
+        original: Image.Image,
+        original_rgb: Image.Image,
+    ) -> Tuple[bool, float, List[ValidationIssue]]:
+        """Run ELA synchronously; see _detect_tampering_ela."""
         findings: List[ValidationIssue] = []
 
         try:
-            # Load original image
-            original = Image.open(image_path)
-
             # Save at 90% quality
             temp_buffer = io.BytesIO()
             original.save(temp_buffer, format='JPEG', quality=90)
@@ -224,7 +297,7 @@ class ImageAnalyzer:
             compressed = Image.open(temp_buffer)
 
             # Calculate difference (ELA)
-            ela_image = ImageChops.difference(original.convert('RGB'), compressed.convert('RGB'))
+            ela_image = ImageChops.difference(original_rgb, compressed.convert('RGB'))
 
             # Enhance to make differences more visible
             extrema = ela_image.getextrema()
@@ -237,18 +310,14 @@ class ImageAnalyzer:
             scale = 255.0 / max_diff
             ela_image = ImageEnhance.Brightness(ela_image).enhance(scale)
 
-            # Convert to numpy for analysis
-            ela_array = np.array(ela_image)
-
-            # Calculate statistics
-            mean_error = np.mean(ela_array)
-            std_error = np.std(ela_array)
-            max_error = np.max(ela_array)
+            # Calculate statistics from the histogram of error levels over all channels
+            level_counts, total_pixels, mean_error, error_variance = level_statistics(ela_image.histogram())
+            std_error = math.sqrt(error_variance)
+            max_error = int(np.flatnonzero(level_counts)[-1])
 
             # Detect anomalous regions (high error levels)
             threshold = mean_error + 2 * std_error
-            anomalous_pixels = np.sum(ela_array > threshold)
-            total_pixels = ela_array.size
+            anomalous_pixels = int(level_counts[UINT8_LEVELS > threshold].sum())
             anomaly_ratio = anomalous_pixels / total_pixels
 
             # Determine tampering likelihood
@@ -279,18 +348,17 @@ class ImageAnalyzer:
             ))
             return False, 0.0, findings
 
-    async def _forensic_analysis(self, image: Image.Image) -> List[ValidationIssue]:
-        """Perform additional forensic checks."""
+    async def _forensic_analysis(self, img_array: np.ndarray) -> List[ValidationIssue]:
+        """Perform additional forensic checks on the decoded RGB array."""
         findings: List[ValidationIssue] = []
 
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-
-        img_array = np.array(image)
+        # Check 1 and 2 are independent NumPy work, so run them in worker threads
+        has_clones, compression_consistent = await asyncio.gather(
+            asyncio.to_thread(self._detect_cloned_regions, img_array),
+            asyncio.to_thread(self._check_compression_consistency, img_array),
+        )
 
         # Check 1: Clone detection (repeated regions)
-        has_clones = self._detect_cloned_regions(img_array)
         if has_clones:
             findings.append(ValidationIssue(
                 category="forensic",
@@ -300,7 +368,6 @@ class ImageAnalyzer:
 
         # Check 2: Consistency in JPEG compression
         # Different parts of the image should have similar compression artifacts
-        compression_consistent = self._check_compression_consistency(img_array)
         if not compression_consistent:
             findings.append(ValidationIssue(
                 category="forensic",
@@ -309,7 +376,7 @@ class ImageAnalyzer:
             ))
 
         # Check 3: Unusual aspect ratio or dimensions
-        width, height = image.size
+        height, width = img_array.shape[:2]
         aspect_ratio = width / height
 
         # Check for unusual dimensions (common in fake documents)
@@ -342,20 +409,11 @@ class ImageAnalyzer:
 
     def _calculate_noise_level(self, img_array: np.ndarray) -> float:
         """Calculate noise level in image."""
-        # Use Laplacian variance as noise estimate
-        gray = np.mean(img_array, axis=2).astype(np.uint8)
+        # Use Laplacian variance as noise estimate; the channel sum is at most
+        # 765, so integer division truncates exactly like the float mean did
+        gray = (img_array.sum(axis=2, dtype=np.uint16) // 3).astype(np.uint8)
 
-        # Simple Laplacian kernel
-        laplacian = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]])
-
-        # Apply convolution (simplified)
-        from scipy.ndimage import convolve
-        try:
-            variance = np.var(convolve(gray, laplacian))
-            return float(variance)
-        except ImportError:
-            # Fallback if scipy not available
-            return 10.0  # Assume normal noise level
+        return uint8_variance(_laplacian_uint8(gray))
 
     def _calculate_color_entropy(self, img_array: np.ndarray) -> float:
         """Calculate color distribution entropy."""
@@ -420,28 +478,57 @@ class ImageAnalyzer:
         # This is a simplified check
         # In production, use more sophisticated algorithms like SIFT matching
 
-        # Calculate image hash for regions
+        # Split the image into non-overlapping regions (the last partial and last
+        # full row/column of regions are skipped, as in a range(0, h - size, size) scan)
         height, width = img_array.shape[:2]
         region_size = 32
 
-        hashes = []
-        for y in range(0, height - region_size, region_size):
-            for x in range(0, width - region_size, region_size):
-                region = img_array[y:y+region_size, x:x+region_size]
-                region_hash = hashlib.md5(region.tobytes()).hexdigest()
-                hashes.append(region_hash)
+        rows = len(range(0, height - region_size, region_size))
+        cols = len(range(0, width - region_size, region_size))
+        total_regions = rows * cols
+        if total_regions == 0:
+            return False
 
-        # Check for duplicate hashes
-        unique_hashes = len(set(hashes))
-        total_hashes = len(hashes)
+        # Regions that differ on the 2x-subsampled grid differ at full resolution
+        # too, so a quarter-size pass finds the only regions that can be duplicates
+        coarse_keys = self._region_keys(
+            self._split_regions(img_array[::2, ::2], rows, cols, region_size // 2).reshape(total_regions, -1)
+        )
+        _, coarse_ids, coarse_counts = np.unique(coarse_keys, return_inverse=True, return_counts=True)
+        candidates = coarse_counts[coarse_ids.ravel()] > 1
+
+        # Check for duplicate regions, comparing full regions for candidates only
+        unique_regions = total_regions - int(np.count_nonzero(candidates))
+        if unique_regions < total_regions:
+            regions = self._split_regions(img_array, rows, cols, region_size)
+            candidate_regions = regions[candidates.reshape(rows, cols)]
+            unique_regions += len(np.unique(self._region_keys(candidate_regions.reshape(len(candidate_regions), -1))))
 
         # If more than 5% duplicates, might have cloned regions
-        duplicate_ratio = 1 - (unique_hashes / total_hashes)
+        duplicate_ratio = 1 - (unique_regions / total_regions)
 
         return duplicate_ratio > 0.05
 
+    @staticmethod
+    def _split_regions(img_array: np.ndarray, rows: int, cols: int, size: int) -> np.ndarray:
+        """View the top-left rows x cols grid of size x size regions as (rows, cols, size, size, channels)."""
+        return img_array[:rows * size, :cols * size].reshape(rows, size, cols, size, -1).swapaxes(1, 2)
+
+    @staticmethod
+    def _region_keys(regions: np.ndarray) -> np.ndarray:
+        """View each row of a 2-D array as one opaque value so rows compare by their raw bytes."""
+        regions = np.ascontiguousarray(regions)
+        return regions.view(np.dtype((np.void, regions.shape[1] * regions.itemsize))).ravel()
+
     def _check_compression_consistency(self, img_array: np.ndarray) -> bool:
         """Check if compression is consistent across image."""
+        # A uniform image has zero variance everywhere and is trivially consistent.
+        # The first row rules out almost every real image before the full scan.
+        if img_array.size:
+            first_value = img_array.flat[0]
+            if (img_array[:1] == first_value).all() and (img_array == first_value).all():
+                return True
+
         # Divide image into quadrants and check variance
         height, width = img_array.shape[:2]
 
@@ -452,7 +539,7 @@ class ImageAnalyzer:
             img_array[height//2:, width//2:],
         ]
 
-        variances = [np.var(q) for q in quadrants]
+        variances = [uint8_variance(q) for q in quadrants]
 
         # Check if variances are similar
         variance_std = np.std(variances)
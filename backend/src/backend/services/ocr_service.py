@@ -1,14 +1,17 @@
 """OCR service using Docling."""
 
+import asyncio
 import time
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Any
-import tempfile
+from functools import cached_property
 
 from docling.document_converter import DocumentConverter
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 
+from backend.services.document_service import convert_document, get_document_converter
 from backend.schemas.ocr import OCRResponse, OCRTextResult, BoundingBox
 
 
@@ -17,12 +20,20 @@ class OCRService:
 
     def __init__(self):
         """Initialize the OCR service."""
-        # Configure Docling with OCR pipeline options
-        self.pipeline_options = PdfPipelineOptions()
-        self.pipeline_options.do_ocr = True
-        self.pipeline_options.do_table_structure = True
+        # The Docling converter loads its models, so it is built lazily on first use
 
-        self.converter = DocumentConverter()
+    @cached_property
+    def pipeline_options(self) -> PdfPipelineOptions:
+        """Docling pipeline options with OCR enabled."""
+        pipeline_options = PdfPipelineOptions()
+        pipeline_options.do_ocr = True
+        pipeline_options.do_table_structure = True
+        return pipeline_options
+
+    @cached_property
+    def converter(self) -> DocumentConverter:
+        """Docling document converter, shared across the process."""
+        return get_document_converter()
 
     async def process_image(
         self,
@@ -35,6 +46,23 @@ class OCRService:
         Args:
             file_path: Path to the image file
 
+        Returns:
+            OCRResponse with extracted text and metadata
+        """
+        return await self._process_source(str(file_path), file_path.name)
+
+    async def _process_source(
+        self,
+        source: Any,
+        file_name: str,
+    ) -> OCRResponse:
+        """
+        Run OCR on a file path or DocumentStream.
+
+        Args:
+            source: Path string or DocumentStream to convert
+            file_name: Name reported in the response metadata
+
         Returns:
             OCRResponse with extracted text and metadata
         """
@@ -42,8 +70,8 @@ class OCRService:
         print("Processing Image...")
 
         try:
-            # Convert the image using Docling
-            result = self.converter.convert(str(file_path))
+            # Convert the image using Docling (in a worker thread, one conversion at a time)
+            result = await convert_document(self.converter, source)
 
             # Extract text content
             text = result.document.export_to_markdown()
@@ -69,7 +97,7 @@ class OCRService:
                 metadata={
                     "engine": "docling",
                     "language": "en",
-                    "file_name": file_path.name,
+                    "file_name": file_name,
                 },
                 processing_time=processing_time,
             )
@@ -93,14 +121,6 @@ class OCRService:
         Returns:
             OCRResponse with extracted text and metadata
         """
-        # Save bytes to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(filename).suffix) as tmp_file:
-            tmp_file.write(file_bytes)
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            return await self.process_image(tmp_path)
-        finally:
-            # Clean up temporary file
-            if tmp_path.exists():
-                tmp_path.unlink()
+        # Docling reads the upload straight from memory, no temporary file needed
+        source = DocumentStream(name=filename, stream=BytesIO(file_bytes))
+        return await self._process_source(source, filename)
@@ -1,5 +1,6 @@
 """Report generation and audit trail service."""
 
+import asyncio
 import json
 import uuid
 from pathlib import Path
@@ -145,21 +146,38 @@ class ReportGenerator:
                 "engines_used": report.engines_used,
             }
 
-            # Save to audit log file (append mode)
             audit_log_file = self.audit_log_path / f"audit_log_{datetime.now().strftime('%Y%m%d')}.jsonl"
-
-            with open(audit_log_file, "a") as f:
-                f.write(json.dumps(audit_entry) + "\n")
-
-            # Also save full report
             report_file = self.audit_log_path / f"report_{report.document_id}.json"
-            with open(report_file, "w") as f:
-                f.write(report.model_dump_json(indent=2))
+
+            # Write off the event loop so large reports don't stall other requests
+            await asyncio.to_thread(
+                self._write_audit_files,
+                audit_log_file,
+                json.dumps(audit_entry) + "\n",
+                report_file,
+                report.model_dump_json(indent=2),
+            )
 
         except Exception as e:
             # Don't fail report generation if audit logging fails
             print(f"Warning: Failed to log audit trail: {str(e)}")
 
+    @staticmethod
+    def _write_audit_files(
+        audit_log_file: Path,
+        audit_line: str,
+        report_file: Path,
+        report_json: str,
+    ) -> None:
+        """Append the audit entry and save the full report (blocking I/O)."""
+        # Save to audit log file (append mode)
+        with open(audit_log_file, "a") as f:
+            f.write(audit_line)
+
+        # Also save full report
+        with open(report_file, "w") as f:
+            f.write(report_json)
+
     async def get_report(self, document_id: str) -> Optional[CorroborationReport]:
         """
         Retrieve a report from audit logs.
@@ -176,10 +194,9 @@ class ReportGenerator:
             if not report_file.exists():
                 return None
 
-            with open(report_file, "r") as f:
-                report_data = json.load(f)
+            report_json = await asyncio.to_thread(report_file.read_text)
 
-            return CorroborationReport(**report_data)
+            return CorroborationReport.model_validate_json(report_json)
 
         except Exception as e:
             print(f"Error retrieving report: {str(e)}")